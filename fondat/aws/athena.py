@@ -819,6 +819,48 @@ class Table:
 
         await self.database.execute(stmt)
 
+    async def insert_many(
+        self,
+        *,
+        rows: Iterable[dict[str, Any]],
+    ):
+        """
+        Insert multiple rows into table in a single statement.
+
+        Parameters:
+        • rows: column key-value pairs to insert; all rows must have the same columns
+
+        Rows are not chunked; the caller must keep rows small enough that the statement does
+        not exceed Athena's maximum query string length (262,144 bytes).
+        """
+
+        rows = list(rows)
+        if not rows:
+            return
+
+        keys = rows[0].keys()
+        if any(row.keys() != keys for row in rows):
+            raise ValueError("rows must have the same columns")
+
+        types = self.python_types(keys)
+
+        stmt = Expression(
+            f'INSERT INTO "{self.name}" (',
+            Expression.join([f'"{k}"' for k in keys], ", "),
+            ") VALUES ",
+            Expression.join(
+                [
+                    Expression(
+                        "(", Expression.join([Param(row[k], types[k]) for k in keys], ", "), ")"
+                    )
+                    for row in rows
+                ],
+                ", ",
+            ),
+        )
+
+        await self.database.execute(stmt)
+
     async def update(self, *, row: dict[str, Any], where: Expression | None):
         """
         Update row(s) in table.
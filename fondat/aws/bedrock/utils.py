@@ -1,13 +1,18 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Any, Dict
 import re
 
 
+_camel_word = re.compile("(.)([A-Z][a-z]+)")
+_camel_boundary = re.compile("([a-z0-9])([A-Z])")
+
+
 def parse_bedrock_datetime(date_str: Optional[str | datetime]) -> Optional[datetime]:
     """
     Parse a datetime string from Bedrock API format to a Python datetime object.
-    Bedrock API returns dates in ISO 8601 format with 'Z' suffix, which needs to be
-    converted to '+00:00' for proper parsing.
+    Bedrock API returns dates in ISO 8601 format with 'Z' suffix, which
+    datetime.fromisoformat accepts natively as of Python 3.11.
 
     Args:
         date_str: The datetime string from Bedrock API, or a datetime object, or None
@@ -19,26 +24,33 @@ def parse_bedrock_datetime(date_str: Optional[str | datetime]) -> Optional[datet
         return None
     if isinstance(date_str, datetime):
         return date_str
-    return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    return datetime.fromisoformat(date_str)
 
 
+@lru_cache(maxsize=4096)
 def camel_to_snake(name: str) -> str:
     """Convert a camelCase string to snake_case."""
-    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    name = _camel_word.sub(r"\1_\2", name)
+    return _camel_boundary.sub(r"\1_\2", name).lower()
 
 
 def convert_dict_keys_to_snake_case(data: Dict[str, Any]) -> Dict[str, Any]:
     """Convert all keys in a dictionary from camelCase to snake_case."""
-
-    def convert_value(v: Any) -> Any:
-        if isinstance(v, dict):
-            return convert_dict_keys_to_snake_case(v)
-        elif isinstance(v, list):
-            return [convert_value(item) for item in v]
-        return v
-
-    return {
-        camel_to_snake(str(k)) if isinstance(k, str) else k: convert_value(v)
-        for k, v in data.items()
-    }
+    result = {}
+    stack = [(data, result)]  # (source, converted) container pairs to fill
+    while stack:
+        source, converted = stack.pop()
+        if isinstance(source, dict):
+            items = source.items()
+        else:
+            converted.extend(source)  # elements are replaced by index below
+            items = enumerate(source)
+        for key, value in items:
+            if isinstance(key, str):
+                key = camel_to_snake(key)
+            if isinstance(value, (dict, list)):
+                converted[key] = {} if isinstance(value, dict) else []
+                stack.append((value, converted[key]))
+            else:
+                converted[key] = value
+    return result
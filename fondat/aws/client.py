@@ -9,6 +9,7 @@ import logging
 from aiobotocore.client import AioBaseClient
 from aiobotocore.session import AioSession
 from botocore.exceptions import ClientError
+from botocore.loaders import Loader, create_loader
 from contextlib import asynccontextmanager, contextmanager
 from fondat.data import datacls
 from typing import Annotated
@@ -29,6 +30,25 @@ class Config:
     config: Annotated[botocore.config.Config | None, "advanced configuration options"]
 
 
+_loaders: dict[str | None, Loader] = {}  # shared data loaders by data path
+
+
+def _session(profile: str | None) -> AioSession:
+    """
+    Return a new session for the specified profile.
+
+    Sessions are not shared, because resolved credentials can hold state bound to an event
+    loop. The botocore data loader, which caches parsed service models, is loop-agnostic and
+    is shared across sessions to avoid reloading models for every client created.
+    """
+    session = AioSession(profile=profile)
+    data_path = session.get_config_variable("data_path")
+    if (loader := _loaders.get(data_path)) is None:
+        loader = _loaders[data_path] = create_loader(data_path)
+    session.register_component("data_loader", loader)
+    return session
+
+
 @asynccontextmanager
 async def create_client(
     service_name: str,
@@ -48,7 +68,7 @@ async def create_client(
     aiobotocore will revert to searching environment variables and files in ~/.aws/.
     """
 
-    session = AioSession(profile=config.profile if config else None)
+    session = _session(config.profile if config else None)
     async with session.create_client(
         service_name=service_name,
         region_name=config.region_name if config else None,
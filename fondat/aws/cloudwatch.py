@@ -3,9 +3,7 @@
 import asyncio
 import logging
 
-from collections import deque
-from collections.abc import Iterable
-from copy import copy
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from fondat.aws.client import Config, create_client
 from fondat.codec import JSONCodec
@@ -16,6 +14,7 @@ from fondat.resource import operation, resource
 from fondat.security import Policy
 from fondat.validation import validate_arguments
 from typing import Annotated, Any, Literal
+from urllib.parse import quote
 
 
 _logger = logging.getLogger(__name__)
@@ -165,10 +164,44 @@ def cloudwatch_resource(
     return CloudWatchResource()
 
 
+MAX_METRIC_DATA = 1000  # maximum metric data per PutMetricData request
+MAX_METRIC_DATA_SIZE = 1_000_000  # PutMetricData request limit is 1 MB; leave headroom
+
+_DATUM_SIZE = 500  # encoded metric datum size, excluding metric name and dimensions
+_DIMENSION_SIZE = 100  # encoded dimension size, excluding name and value
+
+
 def _ascii(value: str) -> str:
     return value.encode("ASCII", "xmlcharrefreplace").decode("ASCII")
 
 
+def _encoded_size(datum: MetricDatum) -> int:
+    """Estimate the encoded size of a metric datum, assuming URL-encoded query parameters."""
+    size = _DATUM_SIZE + len(quote(datum.metric_name, safe=""))
+    for dimension in datum.dimensions:
+        size += _DIMENSION_SIZE
+        size += len(quote(dimension.name, safe="")) + len(quote(dimension.value, safe=""))
+    return size
+
+
+def _batches(metric_data: Iterable[MetricDatum]) -> Iterator[list[MetricDatum]]:
+    """Split metric data into batches within PutMetricData count and size limits."""
+    batch = []
+    size = 0
+    for datum in metric_data:
+        datum_size = _encoded_size(datum)
+        if batch and (
+            len(batch) == MAX_METRIC_DATA or size + datum_size > MAX_METRIC_DATA_SIZE
+        ):
+            yield batch
+            batch = []
+            size = 0
+        batch.append(datum)
+        size += datum_size
+    if batch:
+        yield batch
+
+
 class CloudWatchMonitor(Monitor):
     """
     Monitor that publishes recorded measurements in AWS CloudWatch.
@@ -195,56 +228,52 @@ class CloudWatchMonitor(Monitor):
         self._measurements = []
         self._task = None
 
-    def _round(self, timestamp: datetime) -> datetime:
-        ts = int(timestamp.timestamp())  # truncate milliseconds
-        ts -= ts % self.storage_resolution  # round to beginning of resolution interval
-        return datetime.fromtimestamp(ts, tz=timezone.utc)
+    def _interval(self, timestamp: datetime) -> int:
+        """Return the number of the resolution interval that contains timestamp."""
+        return int(timestamp.timestamp()) // self.storage_resolution  # truncate milliseconds
 
     async def _flush(self):
-        measurements = deque()
+        data = {}  # aggregate measurements sharing name, tags and timestamp
+        rounded = {}  # timestamps for each resolution interval
         for measurement in self._measurements:
-            measurement = copy(measurement)
-            measurement.timestamp = self._round(measurement.timestamp)
-            measurement.value = float(measurement.value)
-            measurements.append(measurement)
-        self._measurements = []  # prevent race between record and flush
-        metric_data = []
-        while measurements:
-            m1 = measurements.popleft()
-            datum = MetricDatum(
-                metric_name=_ascii(m1.name),
-                dimensions={_ascii(k): _ascii(v) for k, v in m1.tags.items()},
-                timestamp=m1.timestamp,
+            interval = self._interval(measurement.timestamp)
+            if (timestamp := rounded.get(interval)) is None:
+                timestamp = rounded[interval] = datetime.fromtimestamp(
+                    interval * self.storage_resolution, tz=timezone.utc
+                )
+            value = float(measurement.value)
+            key = (measurement.name, frozenset(measurement.tags.items()), timestamp)
+            if (datum := data.get(key)) is not None:
+                statistic_values = datum.statistic_values
+                statistic_values.sample_count += 1.0
+                statistic_values.sum += value
+                statistic_values.minimum = min(statistic_values.minimum, value)
+                statistic_values.maximum = max(statistic_values.maximum, value)
+                continue
+            data[key] = MetricDatum(
+                metric_name=_ascii(measurement.name),
+                dimensions=[
+                    Dimension(name=_ascii(k), value=_ascii(v))
+                    for k, v in measurement.tags.items()
+                ],
+                timestamp=timestamp,
                 statistic_values=StatisticSet(
                     sample_count=1.0,
-                    sum=m1.value,
-                    minimum=m1.value,
-                    maximum=m1.value,
+                    sum=value,
+                    minimum=value,
+                    maximum=value,
                 ),
-                unit=unit_conversions.get(m1.unit) or "Counter"
-                if m1.type == "counter"
+                unit=unit_conversions.get(measurement.unit) or "Counter"
+                if measurement.type == "counter"
                 else None,
                 storage_resolution=self.storage_resolution,
             )
-            n = 0
-            while n < len(measurements):
-                m2 = measurements[n]
-                if m2.name == m1.name and m2.tags == m1.tags and m2.timestamp == m1.timestamp:
-                    statistic_values = datum.statistic_values
-                    statistic_values.sample_count += 1.0
-                    statistic_values.sum += m2.value
-                    statistic_values.minimum = min(statistic_values.minimum, m2.value)
-                    statistic_values.maximum = max(statistic_values.maximum, m2.value)
-                    del measurements[n]
-                else:
-                    n += 1
-            metric_data.append(datum)
-            if len(metric_data) == 20 or not measurements:
-                try:
-                    await self._namespace_resource.post(metric_data=metric_data)
-                except Exception as e:
-                    _logger.exception("failure posting metric data")
-                metric_data = []
+        self._measurements = []  # prevent race between record and flush
+        for metric_data in _batches(data.values()):
+            try:
+                await self._namespace_resource.post(metric_data=metric_data)
+            except Exception as e:
+                _logger.exception("failure posting metric data")
 
     async def record(self, measurement: Measurement):
         """Record a measurement."""
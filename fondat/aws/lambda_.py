@@ -1,10 +1,11 @@
 """AWS Lambda module."""
 
 import asyncio
+import binascii
 import fondat.context
 import fondat.http
 
-from base64 import b64decode, b64encode
+from base64 import b64decode
 from collections.abc import Callable, Coroutine
 from fondat.stream import BytesStream
 from typing import Any
@@ -68,12 +69,10 @@ def http_function(
             request.method = http["method"]
             request.path = http["path"]
             request.version = version
-            for key, value in event["headers"].items():
-                request.headers[key] = value
+            request.headers.extend(event["headers"])
             for cookie in event.get("cookies", ()):
                 request.cookies.load(cookie)
-            for key, value in event.get("queryStringParameters", {}).items():
-                request.query[key] = value
+            request.query.extend(event.get("queryStringParameters", {}))
             body = event.get("body")
             if body:
                 request.body = BytesStream(
@@ -85,9 +84,13 @@ def http_function(
             return {
                 "isBase64Encoded": True,
                 "statusCode": response.status,
-                "headers": {k: ", ".join(headers.getall(k)) for k in headers.keys()},
+                "headers": {
+                    k: ", ".join(headers.getall(k)) for k in dict.fromkeys(headers.keys())
+                },
                 "body": (
-                    b64encode(b"".join([b async for b in response.body])).decode()
+                    binascii.b2a_base64(
+                        b"".join([b async for b in response.body]), newline=False
+                    ).decode()
                     if response.body is not None
                     else ""
                 ),
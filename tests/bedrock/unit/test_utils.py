@@ -1,4 +1,5 @@
 import pytest
+import sys
 from datetime import datetime, timezone
 from fondat.aws.bedrock.utils import (
     parse_bedrock_datetime,
@@ -75,3 +76,28 @@ def test_convert_dict_keys_to_snake_case():
     assert convert_dict_keys_to_snake_case({}) == {}
     assert convert_dict_keys_to_snake_case({"emptyList": []}) == {"empty_list": []}
     assert convert_dict_keys_to_snake_case({"emptyDict": {}}) == {"empty_dict": {}}
+
+
+def test_convert_dict_keys_to_snake_case_nested_lists():
+    input_dict = {"outerList": [[{"innerCamel": 1}, 2], [], [[{"deepCamel": 3}]]]}
+    expected = {"outer_list": [[{"inner_camel": 1}, 2], [], [[{"deep_camel": 3}]]]}
+    assert convert_dict_keys_to_snake_case(input_dict) == expected
+
+
+def test_convert_dict_keys_to_snake_case_non_string_keys():
+    input_dict = {1: {"camelCase": 1}, None: "value", (2, 3): [{"innerCamel": 2}]}
+    expected = {1: {"camel_case": 1}, None: "value", (2, 3): [{"inner_camel": 2}]}
+    assert convert_dict_keys_to_snake_case(input_dict) == expected
+
+
+def test_convert_dict_keys_to_snake_case_deep_nesting():
+    depth = sys.getrecursionlimit() + 100
+    input_dict = value = {}
+    for _ in range(depth):
+        value["nestedValue"] = [{}]
+        value = value["nestedValue"][0]
+    value["leafValue"] = 1
+    result = convert_dict_keys_to_snake_case(input_dict)
+    for _ in range(depth):
+        result = result["nested_value"][0]
+    assert result == {"leaf_value": 1}
@@ -0,0 +1,69 @@
+import asyncio
+import botocore.config
+import botocore.session
+import fondat.aws.client
+import pytest
+
+from fondat.aws.client import Config
+from uuid import uuid4
+
+
+config = Config(  # for clients shared across tests; default retries, bounded connect
+    config=botocore.config.Config(max_pool_connections=50, connect_timeout=5),
+)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def aws_credentials():
+    """Skip tests that call AWS services if no credentials can be resolved."""
+    if botocore.session.Session().get_credentials() is None:
+        pytest.skip("AWS credentials not available")
+
+
+@pytest.fixture(scope="session")
+async def secretsmanager_client(aws_credentials):
+    async with fondat.aws.client.create_client("secretsmanager", config=config) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+async def s3_client(aws_credentials):
+    async with fondat.aws.client.create_client("s3", config=config) as client:
+        yield client
+
+
+async def _empty(client, bucket):
+    while "Contents" in (response := await client.list_objects_v2(Bucket=bucket)):
+        await client.delete_objects(
+            Bucket=bucket,
+            Delete={
+                "Objects": [{"Key": item["Key"]} for item in response["Contents"]],
+                "Quiet": True,
+            },
+        )
+
+
+@pytest.fixture(scope="session")
+async def s3_bucket(s3_client):
+    """S3 bucket shared by all tests in the session."""
+    name = str(uuid4())
+    await s3_client.create_bucket(Bucket=name)
+    try:
+        yield name
+    finally:
+        await _empty(s3_client, name)
+        await s3_client.delete_bucket(Bucket=name)
+
+
+@pytest.fixture(scope="function")
+async def bucket(s3_client, s3_bucket):
+    """Shared S3 bucket, emptied before each test."""
+    await _empty(s3_client, s3_bucket)
+    yield s3_bucket
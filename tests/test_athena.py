@@ -1,4 +1,3 @@
-import asyncio
 import fondat.aws.athena as athena
 import random
 import string
@@ -7,21 +6,14 @@ from datetime import date, datetime
 from decimal import Decimal
 from fondat.aws.athena import Column, Expression, Param, Table
 from fondat.types import literal_values
-from pytest import fixture
+from pytest import fixture, mark, raises
 from types import NoneType
 from typing import Literal
 from uuid import UUID
 
 
 @fixture(scope="module")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
-@fixture(scope="module")
-async def database():
+async def database(aws_credentials):
     name = "db-" + "".join(random.choices(string.ascii_lowercase, k=8))
     db = athena.Database(name=name, workgroup="primary")
     await db.create()
@@ -29,69 +21,55 @@ async def database():
     await db.drop(cascade=True)
 
 
-async def _test_values(type, *values):
-    codec = athena.AthenaCodec.get(type)
-    db = athena.Database(name="foo", workgroup="primary")
-    stmt = Expression("SELECT ")
-    v = []
-    for n in range(len(values)):
-        v.append(Expression(Param(values[n], type), f" AS v{n}"))
-    stmt += Expression.join(v, ", ")
-    async for row in await db.execute(stmt, decode=True):
-        for n in range(len(values)):
-            assert row[f"v{n}"] == values[n]
-
-
-async def test_str():
-    await _test_values(str, "a", "b'c", "d''e")
-
-
-async def test_bytes():
-    await _test_values(bytes, b"\x01\x02\x03", b"hello", "world".encode())
-
-
-async def test_boolean():
-    await _test_values(bool, True, False)
-
-
-async def test_int():
-    await _test_values(int, 1, 2, 3)
-
-
-async def test_float():
-    await _test_values(float, 0.3, 1.1, 2.2, 3.3)
-
-
-async def test_decimal():
-    await _test_values(Decimal, Decimal("0.3"), Decimal("1.1111111111"))
-
-
-async def test_date():
-    await _test_values(date, date(2022, 9, 8), date.fromisoformat("2022-09-09"))
+_values_db = athena.Database(name="foo", workgroup="primary")
 
 
-async def test_datetime():
-    await _test_values(
-        datetime,
-        datetime(2022, 9, 8, 1, 2, 3, 456000),
-        datetime.fromisoformat("2022-01-02T03:04:05.678"),
-    )
-
-
-async def test_none():
-    await _test_values(NoneType, None)
-
-
-async def test_union():
-    UT = str | None
-    await _test_values(UT, "a", None)
-
-
-async def test_literal():
+async def _test_typed_values(*typed_values):
+    stmt = Expression("SELECT ")
+    for n, (type, value) in enumerate(typed_values):
+        if n:
+            stmt += ", "
+        stmt += Param(value, type)
+        stmt += f" AS v{n}"
+    async for row in await _values_db.execute(stmt, decode=True):
+        for n, (_, value) in enumerate(typed_values):
+            assert row[f"v{n}"] == value
+
+
+@mark.integration
+@mark.usefixtures("aws_credentials")
+async def test_all_types():
     L = Literal["a", "b", "c"]
-    await _test_values(L, *literal_values(L))
+    await _test_typed_values(
+        (str, "a"),
+        (str, "b'c"),
+        (str, "d''e"),
+        (bytes, b"\x01\x02\x03"),
+        (bytes, b"hello"),
+        (bytes, "world".encode()),
+        (bool, True),
+        (bool, False),
+        (int, 1),
+        (int, 2),
+        (int, 3),
+        (float, 0.3),
+        (float, 1.1),
+        (float, 2.2),
+        (float, 3.3),
+        (Decimal, Decimal("0.3")),
+        (Decimal, Decimal("1.1111111111")),
+        (date, date(2022, 9, 8)),
+        (date, date.fromisoformat("2022-09-09")),
+        (datetime, datetime(2022, 9, 8, 1, 2, 3, 456000)),
+        (datetime, datetime.fromisoformat("2022-01-02T03:04:05.678")),
+        (NoneType, None),
+        (str | None, "a"),
+        (str | None, None),
+        *((L, value) for value in literal_values(L)),
+    )
 
 
+@mark.integration
 async def test_uuid(database):
     value = UUID("2093f88a-99ab-4807-87f7-ab3997a199b5")
     stmt = Expression("SELECT ", Param(value), " AS value")
@@ -99,6 +77,7 @@ async def test_uuid(database):
         assert athena.AthenaCodec.get(UUID).decode(row["value"]) == value
 
 
+@mark.integration
 async def test_crud(database):
 
     table = Table(
@@ -161,6 +140,7 @@ async def test_crud(database):
     await table.drop()
 
 
+@mark.integration
 async def test_pagination(database):
 
     table = Table(database=database, name="foo", columns=[Column("id", "bigint", int)])
@@ -173,11 +153,29 @@ async def test_pagination(database):
 
     ROW_COUNT = 10
 
-    for n in range(ROW_COUNT):
-        row = {"id": n}
-        await table.insert(row=row)
+    await table.insert_many(rows=[{"id": n} for n in range(ROW_COUNT)])
 
     rows = [row async for row in await database.execute("SELECT id FROM foo", page_size=2)]
     assert len(rows) == ROW_COUNT
 
     await table.drop()
+
+
+async def test_insert_many_statement(monkeypatch):
+    database = athena.Database(name="foo")
+    statements = []
+
+    async def execute(stmt):
+        statements.append(athena.expand_expression(stmt))
+
+    monkeypatch.setattr(database, "execute", execute)
+    table = Table(
+        database=database,
+        name="foo",
+        columns=[Column("id", "bigint", int), Column("s", "string")],
+    )
+    await table.insert_many(rows=[{"s": "a", "id": 0}, {"id": 1, "s": None}])
+    assert statements == ['INSERT INTO "foo" ("s", "id") VALUES (\'a\', 0), (NULL, 1)']
+    with raises(ValueError):
+        await table.insert_many(rows=[{"id": 2, "s": "b"}, {"id": 3}])
+    assert len(statements) == 1
@@ -1,13 +1,18 @@
+import botocore.serialize
+import botocore.session
+
 from datetime import datetime, timezone
 from fondat.aws.cloudwatch import (
     CloudWatchMonitor,
     Dimension,
     MetricDatum,
     StatisticSet,
+    _awsify,
     cloudwatch_resource,
 )
 from fondat.monitor import Measurement
-from pytest import fixture
+from pytest import fixture, mark
+from urllib.parse import urlencode
 
 
 _now = lambda: datetime.now(tz=timezone.utc)
@@ -17,7 +22,7 @@ NAMESPACE = "Fondat/Test"
 
 
 @fixture(scope="module")
-def namespace_resource():
+def namespace_resource(aws_credentials):
     return cloudwatch_resource().namespace(NAMESPACE)
 
 
@@ -70,6 +75,7 @@ async def test_put_metric_statistics(namespace_resource):
     )
 
 
+@mark.usefixtures("aws_credentials")
 async def test_monitor():
     monitor = CloudWatchMonitor(namespace=NAMESPACE, storage_resolution=60)
     for n in range(10):
@@ -83,3 +89,71 @@ async def test_monitor():
             )
         )
     await monitor.flush()
+
+
+def _stub_monitor() -> tuple[CloudWatchMonitor, list[list[MetricDatum]]]:
+    monitor = CloudWatchMonitor(namespace=NAMESPACE, cache_size=2000)
+    posted = []
+
+    async def post(metric_data):
+        posted.append(metric_data)
+
+    monitor._namespace_resource.post = post
+    return monitor, posted
+
+
+async def test_monitor_aggregate():
+    monitor, posted = _stub_monitor()
+    timestamp = datetime(2021, 1, 1, 0, 0, 30, tzinfo=timezone.utc)
+    for value in (3, 1, 5):
+        await monitor.record(
+            Measurement(
+                name="test_monitor_aggregate",
+                tags={"a": "b"},
+                timestamp=timestamp,
+                type="gauge",
+                value=value,
+            )
+        )
+    await monitor.flush()
+    assert len(posted) == 1
+    assert len(posted[0]) == 1
+    datum = posted[0][0]
+    assert datum.metric_name == "test_monitor_aggregate"
+    assert datum.timestamp == datetime(2021, 1, 1, tzinfo=timezone.utc)
+    assert datum.statistic_values == StatisticSet(
+        sample_count=3.0, sum=9.0, minimum=1.0, maximum=5.0
+    )
+
+
+async def test_monitor_batches():
+    monitor, posted = _stub_monitor()
+    for n in range(1200):
+        await monitor.record(
+            Measurement(
+                name=f"test_monitor_batches_{n}", tags={"a": "b"}, type="gauge", value=n
+            )
+        )
+    await monitor.flush()
+    assert [len(metric_data) for metric_data in posted] == [1000, 200]
+
+
+def _query_size(metric_data: list[MetricDatum]) -> int:
+    session = botocore.session.get_session()
+    operation = session.get_service_model("cloudwatch").operation_model("PutMetricData")
+    request = botocore.serialize.create_serializer("query").serialize_to_request(
+        {"Namespace": NAMESPACE, "MetricData": _awsify(metric_data)}, operation
+    )
+    return len(urlencode(request["body"]))
+
+
+async def test_monitor_batches_size():
+    monitor, posted = _stub_monitor()
+    tags = {f"tag{n}": "v" * 60 for n in range(10)}
+    for n in range(1000):
+        await monitor.record(
+            Measurement(name=f"test_monitor_size_{n:04}", tags=tags, type="gauge", value=n)
+        )
+    await monitor.flush()
+    assert [len(metric_data) for metric_data in posted] == [462, 462, 76]
+    assert all(_query_size(metric_data) < 1024 * 1024 for metric_data in posted)
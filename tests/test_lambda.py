@@ -1,6 +1,7 @@
 import fondat.http
 import http
 import multidict
+import pytest
 
 from base64 import b64decode, b64encode
 from fondat.aws.lambda_ import async_function, http_function
@@ -9,6 +10,50 @@ from fondat.resource import operation, resource
 from typing import Annotated
 
 
+_GET_EVENT = {
+    "version": "2.0",
+    "routeKey": "ANY /",
+    "rawPath": "/",
+    "rawQueryString": "",
+    "headers": {
+        "accept": "application/json",
+        "accept-encoding": "gzip, deflate",
+        "content-length": "0",
+        "host": "test.execute-api.region-1.amazonaws.com",
+        "user-agent": "Test/1.0",
+        "x-amzn-trace-id": "Root=1-23456789-abcdef0123456789abcdef01",
+        "x-forwarded-for": "127.0.0.1",
+        "x-forwarded-port": "443",
+        "x-forwarded-proto": "https",
+    },
+    "requestContext": {
+        "accountId": "123456789012",
+        "apiId": "1abc2de3f4",
+        "domainName": "test.execute-api.region-1.amazonaws.com",
+        "domainPrefix": "test",
+        "http": {
+            "method": "GET",
+            "path": "/",
+            "protocol": "HTTP/1.1",
+            "sourceIp": "127.0.0.1",
+            "userAgent": "Test/1.0",
+        },
+        "requestId": "AQIDBAUGB1w4XDkICQ==",
+        "routeKey": "ANY /",
+        "stage": "$default",
+        "time": "01/Jan/2021:00:00:00 +0000",
+        "timeEpoch": 1609488000000,
+    },
+    "isBase64Encoded": False,
+}
+
+
+_POST_EVENT = _GET_EVENT | {
+    "requestContext": _GET_EVENT["requestContext"]
+    | {"http": _GET_EVENT["requestContext"]["http"] | {"method": "POST"}},
+}
+
+
 def test_http_get():
     @resource
     class Resource:
@@ -18,42 +63,7 @@ def test_http_get():
 
     function = http_function(fondat.http.Application(Resource()))
 
-    event = {
-        "version": "2.0",
-        "routeKey": "ANY /",
-        "rawPath": "/",
-        "rawQueryString": "",
-        "headers": {
-            "accept": "application/json",
-            "accept-encoding": "gzip, deflate",
-            "content-length": "0",
-            "host": "test.execute-api.region-1.amazonaws.com",
-            "user-agent": "Test/1.0",
-            "x-amzn-trace-id": "Root=1-23456789-abcdef0123456789abcdef01",
-            "x-forwarded-for": "127.0.0.1",
-            "x-forwarded-port": "443",
-            "x-forwarded-proto": "https",
-        },
-        "requestContext": {
-            "accountId": "123456789012",
-            "apiId": "1abc2de3f4",
-            "domainName": "test.execute-api.region-1.amazonaws.com",
-            "domainPrefix": "test",
-            "http": {
-                "method": "GET",
-                "path": "/",
-                "protocol": "HTTP/1.1",
-                "sourceIp": "127.0.0.1",
-                "userAgent": "Test/1.0",
-            },
-            "requestId": "AQIDBAUGB1w4XDkICQ==",
-            "routeKey": "ANY /",
-            "stage": "$default",
-            "time": "01/Jan/2021:00:00:00 +0000",
-            "timeEpoch": 1609488000000,
-        },
-        "isBase64Encoded": False,
-    }
+    event = _GET_EVENT
 
     response = function(event, None)
     headers = multidict.CIMultiDict(response["headers"])
@@ -64,7 +74,25 @@ def test_http_get():
     assert b64decode(response["body"]) == b"str"
 
 
-def test_http_post():
+def test_http_get_query():
+    @resource
+    class Resource:
+        @operation
+        async def get(self, foo: str) -> str:
+            return foo
+
+    function = http_function(fondat.http.Application(Resource()))
+
+    event = _GET_EVENT | {"rawQueryString": "foo=bar", "queryStringParameters": {"foo": "bar"}}
+
+    response = function(event, None)
+
+    assert response["statusCode"] == http.HTTPStatus.OK.value
+    assert b64decode(response["body"]) == b"bar"
+
+
+@pytest.mark.parametrize("base64", [False, True])
+def test_http_post(base64):
     @resource
     class Resource:
         @operation
@@ -75,42 +103,10 @@ def test_http_post():
 
     body = "content goes here"
 
-    event = {
-        "version": "2.0",
-        "routeKey": "ANY /",
-        "rawPath": "/",
-        "rawQueryString": "",
-        "headers": {
-            "accept": "application/json",
-            "accept-encoding": "gzip, deflate",
-            "content-length": str(len(body)),
-            "host": "test.execute-api.region-1.amazonaws.com",
-            "user-agent": "Test/1.0",
-            "x-amzn-trace-id": "Root=1-23456789-abcdef0123456789abcdef01",
-            "x-forwarded-for": "127.0.0.1",
-            "x-forwarded-port": "443",
-            "x-forwarded-proto": "https",
-        },
-        "requestContext": {
-            "accountId": "123456789012",
-            "apiId": "1abc2de3f4",
-            "domainName": "test.execute-api.region-1.amazonaws.com",
-            "domainPrefix": "test",
-            "http": {
-                "method": "POST",
-                "path": "/",
-                "protocol": "HTTP/1.1",
-                "sourceIp": "127.0.0.1",
-                "userAgent": "Test/1.0",
-            },
-            "requestId": "AQIDBAUGB1w4XDkICQ==",
-            "routeKey": "ANY /",
-            "stage": "$default",
-            "time": "01/Jan/2021:00:00:00 +0000",
-            "timeEpoch": 1609488000000,
-        },
-        "isBase64Encoded": True,
-        "body": b64encode(body.encode()),
+    event = _POST_EVENT | {
+        "headers": _POST_EVENT["headers"] | {"content-length": str(len(body))},
+        "isBase64Encoded": base64,
+        "body": b64encode(body.encode()) if base64 else body,
     }
 
     response = function(event, None)
@@ -1,5 +1,4 @@
 import asyncio
-import fondat.aws.client
 import fondat.aws.s3
 import pytest
 
@@ -9,64 +8,26 @@ from fondat.aws.s3 import BucketResource, ObjectResource
 from fondat.error import NotFoundError
 from fondat.pagination import paginate
 from fondat.stream import BytesStream, Reader, Stream
-from pytest import fixture
 from random import randbytes
 from typing import TypedDict
-from uuid import uuid4
 
 
-@fixture(scope="module")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
-@fixture(scope="module")
-async def client():
-    async with fondat.aws.client.create_client("s3") as client:
-        yield client
-
-
-async def _empty(bucket):
-    async with fondat.aws.client.create_client("s3") as client:
-        while "Contents" in (response := await client.list_objects_v2(Bucket=bucket)):
-            for item in response["Contents"]:
-                await client.delete_object(Bucket=bucket, Key=item["Key"])
-
-
-@fixture(scope="module")
-async def _bucket(client):
-    name = str(uuid4())
-    await client.create_bucket(Bucket=name)
-    try:
-        yield name
-    finally:
-        await _empty(name)
-        await client.delete_bucket(Bucket=name)
-
-
-@fixture(scope="function")
-async def bucket(_bucket):
-    await _empty(_bucket)
-    yield _bucket
+@dataclass
+class DC:
+    id: str
+    str_: str | None
+    dict_: TypedDict("TD", {"a": int}) | None
+    list_: list[int] | None
+    set_: set[str] | None
+    int_: int | None
+    float_: float | None
+    bool_: bool | None
+    bytes_: bytes | None
+    date_: date | None
+    datetime_: datetime | None
 
 
 async def test_crud(bucket):
-    @dataclass
-    class DC:
-        id: str
-        str_: str | None
-        dict_: TypedDict("TD", {"a": int}) | None
-        list_: list[int] | None
-        set_: set[str] | None
-        int_: int | None
-        float_: float | None
-        bool_: bool | None
-        bytes_: bytes | None
-        date_: date | None
-        datetime_: datetime | None
-
     resource = BucketResource(name=bucket, value_type=DC)
     id = "7af8410d-ffa3-4598-bac8-9ac0e488c9df"
     value = DC(
@@ -105,8 +66,9 @@ async def test_pagination(bucket):
     resource = BucketResource(name=bucket, value_type=str)
     assert len([v async for v in paginate(resource.get)]) == 0
     count = 10
-    for n in range(count):
-        await resource[f"{n:04d}"].put("value")
+    async with asyncio.TaskGroup() as tg:
+        for n in range(count):
+            tg.create_task(resource[f"{n:04d}"].put("value"))
     assert len([v async for v in paginate(resource.get)]) == count
     page = await resource.get(limit=count - 2)
     assert len(page.items) == count - 2
@@ -123,12 +85,13 @@ async def test_prefix_suffix(bucket):
     )
     assert len([v async for v in paginate(resource.get)]) == 0
     count = 5
-    for n in range(0, count):
-        await resource[f"{n:04d}"].put(str(n))
+    async with asyncio.TaskGroup() as tg:
+        for n in range(count):
+            tg.create_task(resource[f"{n:04d}"].put(str(n)))
     keys = [key async for key in paginate(resource.get)]
     assert len(keys) == count
-    for key in keys:
-        assert await resource[key].get() == str(int(key))
+    values = await asyncio.gather(*(resource[key].get() for key in keys))
+    assert values == [str(int(key)) for key in keys]
 
 
 async def test_stream_basic(bucket):
@@ -1,5 +1,5 @@
 import asyncio
-import fondat.aws.client
+import itertools
 import pytest
 
 from fondat.aws.secretsmanager import Secret, secrets_resource
@@ -8,11 +8,15 @@ from pytest import fixture
 from uuid import uuid4
 
 
-@fixture(scope="module")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+pytestmark = pytest.mark.usefixtures("aws_credentials")
+
+
+_prefix = str(uuid4())  # unique across runs
+_counter = itertools.count()
+
+
+def _name():
+    return f"{_prefix}-{next(_counter)}"
 
 
 @fixture(scope="module")
@@ -21,7 +25,7 @@ async def resource():
 
 
 async def test_string_binary(resource):
-    name = str(uuid4())
+    name = _name()
     with pytest.raises(NotFoundError):
         await resource[name].delete()
     with pytest.raises(NotFoundError):
@@ -36,7 +40,7 @@ async def test_string_binary(resource):
 
 
 async def test_binary_string(resource):
-    name = str(uuid4())
+    name = _name()
     await resource.post(name=name, secret=Secret(value=b"binary"))
     assert (await resource[name].get()).value == b"binary"
     await resource[name].put(Secret(value="string"))
@@ -44,30 +48,28 @@ async def test_binary_string(resource):
     await resource[name].delete()
 
 
-async def test_get_cache():
-    async with fondat.aws.client.create_client("secretsmanager") as client:
-        resource = secrets_resource(cache_size=10, cache_expire=10)
-        name = str(uuid4())
-        secret = Secret(value=name)
-        await client.create_secret(Name=name, SecretString=secret.value)
-        assert await resource[name].get() == secret  # caches secret
-        await client.delete_secret(SecretId=name)
-        assert await resource[name].get() == secret  # still cached
+async def test_get_cache(secretsmanager_client):
+    resource = secrets_resource(cache_size=10, cache_expire=10)
+    name = _name()
+    secret = Secret(value=name)
+    await secretsmanager_client.create_secret(Name=name, SecretString=secret.value)
+    assert await resource[name].get() == secret  # caches secret
+    await secretsmanager_client.delete_secret(SecretId=name)
+    assert await resource[name].get() == secret  # still cached
 
 
-async def test_put_get_cache():
-    async with fondat.aws.client.create_client("secretsmanager") as client:
-        resource = secrets_resource(cache_size=10, cache_expire=10)
-        name = str(uuid4())
-        secret = Secret(value=name)
-        await resource.post(name=name, secret=secret)  # caches secret
-        await client.delete_secret(SecretId=name)
-        assert await resource[name].get() == secret  # still cached
+async def test_put_get_cache(secretsmanager_client):
+    resource = secrets_resource(cache_size=10, cache_expire=10)
+    name = _name()
+    secret = Secret(value=name)
+    await resource.post(name=name, secret=secret)  # caches secret
+    await secretsmanager_client.delete_secret(SecretId=name)
+    assert await resource[name].get() == secret  # still cached
 
 
 async def test_delete_cache():
     resource = secrets_resource(cache_size=10, cache_expire=10)
-    name = str(uuid4())
+    name = _name()
     secret = Secret(value=name)
     await resource.post(name=name, secret=secret)  # caches secret
     await resource[name].get()  # still cached
@@ -76,19 +78,22 @@ async def test_delete_cache():
         await resource[name].get()
 
 
-async def test_get_cache_evict():
-    async with fondat.aws.client.create_client("secretsmanager") as client:
-        resource = secrets_resource(cache_size=1, cache_expire=10)
-        name1 = str(uuid4())
-        secret1 = Secret(value=name1)
-        await client.create_secret(Name=name1, SecretString=secret1.value)
-        name2 = str(uuid4())
-        secret2 = Secret(value=name2)
-        await client.create_secret(Name=name2, SecretString=secret2.value)
-        assert await resource[name1].get() == secret1
-        assert await resource[name2].get() == secret2
-        await client.delete_secret(SecretId=name1)
-        await client.delete_secret(SecretId=name2)
-        with pytest.raises(BadRequestError):
-            await resource[name1].get()  # evicted and marked deleted
-        assert await resource[name2].get() == secret2  # still cached
+async def test_get_cache_evict(secretsmanager_client):
+    resource = secrets_resource(cache_size=1, cache_expire=10)
+    name1 = _name()
+    secret1 = Secret(value=name1)
+    name2 = _name()
+    secret2 = Secret(value=name2)
+    await asyncio.gather(
+        secretsmanager_client.create_secret(Name=name1, SecretString=secret1.value),
+        secretsmanager_client.create_secret(Name=name2, SecretString=secret2.value),
+    )
+    assert await resource[name1].get() == secret1
+    assert await resource[name2].get() == secret2
+    await asyncio.gather(
+        secretsmanager_client.delete_secret(SecretId=name1),
+        secretsmanager_client.delete_secret(SecretId=name2),
+    )
+    with pytest.raises(BadRequestError):
+        await resource[name1].get()  # evicted and marked deleted
+    assert await resource[name2].get() == secret2  # still cached